@@ -1,7 +1,6 @@
 import time
 import warnings
 from abc import ABC
-from copy import deepcopy
 from typing import Optional
 
 import torch
@@ -65,6 +64,10 @@ class MaxLengthCriteria(StoppingCriteria):
 
     @add_start_docstrings(STOPPING_CRITERIA_INPUTS_DOCSTRING)
     def __call__(self, input_ids: torch.LongTensor, scores: torch.FloatTensor, **kwargs) -> torch.BoolTensor:
+        is_done = self._is_done(input_ids)
+        return torch.full((input_ids.shape[0],), is_done, device=input_ids.device, dtype=torch.bool)
+
+    def _is_done(self, input_ids: torch.LongTensor) -> bool:
         cur_len = input_ids.shape[-1]
         is_done = cur_len >= self.max_length
         if self.max_position_embeddings is not None and not is_done and cur_len >= self.max_position_embeddings:
@@ -73,7 +76,7 @@ class MaxLengthCriteria(StoppingCriteria):
                 f"maximum length ({self.max_position_embeddings}). Depending on the model, you may observe "
                 "exceptions, performance degradation, or nothing at all."
             )
-        return torch.full((input_ids.shape[0],), is_done, device=input_ids.device, dtype=torch.bool)
+        return is_done
 
 
 class MaxNewTokensCriteria(StoppingCriteria):
@@ -102,9 +105,12 @@ class MaxNewTokensCriteria(StoppingCriteria):
 
     @add_start_docstrings(STOPPING_CRITERIA_INPUTS_DOCSTRING)
     def __call__(self, input_ids: torch.LongTensor, scores: torch.FloatTensor, **kwargs) -> torch.BoolTensor:
-        is_done = input_ids.shape[-1] >= self.max_length
+        is_done = self._is_done(input_ids)
         return torch.full((input_ids.shape[0],), is_done, device=input_ids.device, dtype=torch.bool)
 
+    def _is_done(self, input_ids: torch.LongTensor) -> bool:
+        return input_ids.shape[-1] >= self.max_length
+
 
 class MaxTimeCriteria(StoppingCriteria):
     """
@@ -125,15 +131,32 @@ class MaxTimeCriteria(StoppingCriteria):
 
     @add_start_docstrings(STOPPING_CRITERIA_INPUTS_DOCSTRING)
     def __call__(self, input_ids: torch.LongTensor, scores: torch.FloatTensor, **kwargs) -> torch.BoolTensor:
-        is_done = time.time() - self.initial_timestamp > self.max_time
+        is_done = self._is_done(input_ids)
         return torch.full((input_ids.shape[0],), is_done, device=input_ids.device, dtype=torch.bool)
 
+    def _is_done(self, input_ids: torch.LongTensor) -> bool:
+        return time.time() - self.initial_timestamp > self.max_time
+
+
+# `__call__` of the criteria whose decision is the same for every row and can be computed on CPU with `_is_done`.
+# Subclasses that override `__call__` (e.g. with per-row logic) are not in this set and are always called directly.
+_SCALAR_CRITERIA_CALLS = {MaxLengthCriteria.__call__, MaxNewTokensCriteria.__call__, MaxTimeCriteria.__call__}
+
 
 class StoppingCriteriaList(list):
     @add_start_docstrings(STOPPING_CRITERIA_INPUTS_DOCSTRING)
     def __call__(self, input_ids: torch.LongTensor, scores: torch.FloatTensor, **kwargs) -> torch.BoolTensor:
-        is_done = torch.full((input_ids.shape[0],), False, device=input_ids.device)
+        # Scalar criteria are evaluated first, as plain Python bools: if any of them fires, every row is done and the
+        # remaining (potentially expensive) criteria can be skipped without touching the device.
+        tensor_criteria = []
         for criteria in self:
+            if type(criteria).__call__ not in _SCALAR_CRITERIA_CALLS:
+                tensor_criteria.append(criteria)
+            elif criteria._is_done(input_ids):
+                return torch.full((input_ids.shape[0],), True, device=input_ids.device, dtype=torch.bool)
+
+        is_done = torch.full((input_ids.shape[0],), False, device=input_ids.device, dtype=torch.bool)
+        for criteria in tensor_criteria:
             is_done = is_done | criteria(input_ids, scores, **kwargs)
         return is_done
 
@@ -149,7 +172,7 @@ class StoppingCriteriaList(list):
 
 def validate_stopping_criteria(stopping_criteria: StoppingCriteriaList, max_length: int) -> StoppingCriteriaList:
     stopping_max_length = stopping_criteria.max_length
-    new_stopping_criteria = deepcopy(stopping_criteria)
+    new_stopping_criteria = StoppingCriteriaList(stopping_criteria)
     if stopping_max_length is not None and stopping_max_length != max_length:
         warnings.warn("You set different `max_length` for stopping criteria and `max_length` parameter", UserWarning)
     elif stopping_max_length is None:
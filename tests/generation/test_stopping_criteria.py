@@ -29,6 +29,7 @@ if is_torch_available():
         MaxLengthCriteria,
         MaxNewTokensCriteria,
         MaxTimeCriteria,
+        StoppingCriteria,
         StoppingCriteriaList,
         validate_stopping_criteria,
     )
@@ -62,6 +63,77 @@ class StoppingCriteriaTestCase(unittest.TestCase):
         input_ids, scores = self._get_tensors(10)
         self.assertTrue(all(criteria(input_ids, scores)))
 
+    def _get_row_criteria(self, stopped_rows):
+        class RowCriteria(StoppingCriteria):
+            """Stops the rows in `stopped_rows` and counts how many times it was called."""
+
+            def __init__(self):
+                self.num_calls = 0
+
+            def __call__(self, input_ids, scores, **kwargs):
+                self.num_calls += 1
+                is_done = torch.zeros((input_ids.shape[0],), device=input_ids.device, dtype=torch.bool)
+                is_done[stopped_rows] = True
+                return is_done
+
+        return RowCriteria()
+
+    def test_list_criteria_short_circuit(self):
+        row_criteria = self._get_row_criteria([])
+        criteria = StoppingCriteriaList([row_criteria, MaxLengthCriteria(max_length=10)])
+
+        input_ids, scores = self._get_tensors(5)
+        self.assertFalse(any(criteria(input_ids, scores)))
+        self.assertEqual(row_criteria.num_calls, 1)
+
+        # once `MaxLengthCriteria` fires, the remaining criteria are not evaluated
+        input_ids, scores = self._get_tensors(10)
+        self.assertTrue(all(criteria(input_ids, scores)))
+        self.assertEqual(row_criteria.num_calls, 1)
+
+        # same for `MaxTimeCriteria`
+        row_criteria = self._get_row_criteria([])
+        criteria = StoppingCriteriaList(
+            [row_criteria, MaxTimeCriteria(max_time=0.1, initial_timestamp=time.time() - 0.2)]
+        )
+        input_ids, scores = self._get_tensors(5)
+        self.assertTrue(all(criteria(input_ids, scores)))
+        self.assertEqual(row_criteria.num_calls, 0)
+
+    def test_list_criteria_per_row(self):
+        # no scalar criterion fires: the result is the per-row OR of the remaining criteria
+        first_row_criteria = self._get_row_criteria([0])
+        last_row_criteria = self._get_row_criteria([2])
+        criteria = StoppingCriteriaList(
+            [
+                first_row_criteria,
+                MaxLengthCriteria(max_length=10),
+                MaxTimeCriteria(max_time=10),
+                last_row_criteria,
+            ]
+        )
+
+        input_ids, scores = self._get_tensors(5)
+        self.assertListEqual(criteria(input_ids, scores).tolist(), [True, False, True])
+        self.assertEqual(first_row_criteria.num_calls, 1)
+        self.assertEqual(last_row_criteria.num_calls, 1)
+
+    def test_list_criteria_overridden_call(self):
+        class FirstRowMaxLengthCriteria(MaxLengthCriteria):
+            def __call__(self, input_ids, scores, **kwargs):
+                is_done = super().__call__(input_ids, scores, **kwargs)
+                is_done[1:] = False
+                return is_done
+
+        criteria = StoppingCriteriaList([FirstRowMaxLengthCriteria(max_length=10)])
+
+        input_ids, scores = self._get_tensors(5)
+        self.assertListEqual(criteria(input_ids, scores).tolist(), [False, False, False])
+
+        # the overridden `__call__` is honoured instead of stopping every row
+        input_ids, scores = self._get_tensors(10)
+        self.assertListEqual(criteria(input_ids, scores).tolist(), [True, False, False])
+
     def test_max_length_criteria(self):
         criteria = MaxLengthCriteria(max_length=10)
 
@@ -104,6 +176,8 @@ class StoppingCriteriaTestCase(unittest.TestCase):
         with self.assertWarns(UserWarning):
             validate_stopping_criteria(StoppingCriteriaList([MaxLengthCriteria(10)]), 11)
 
-        stopping_criteria = validate_stopping_criteria(StoppingCriteriaList(), 11)
+        original_stopping_criteria = StoppingCriteriaList()
+        stopping_criteria = validate_stopping_criteria(original_stopping_criteria, 11)
 
         self.assertEqual(len(stopping_criteria), 1)
+        self.assertEqual(len(original_stopping_criteria), 0)